@@ -28,6 +28,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--config", type=Path, help="Optional JSON file overriding settings")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     parser.add_argument("--email", type=str, default=None, help="Contact email passed to the geocoding provider")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Number of listing pages fetched in parallel (rate limit still applies)",
+    )
     parser.add_argument(
         "--pause",
         type=float,
@@ -59,6 +65,8 @@ def main(argv: list[str] | None = None) -> int:
         fetch_config["max_pages"] = args.max_pages
     if args.pause is not None:
         fetch_config["pause_seconds"] = args.pause
+    if args.concurrency is not None:
+        fetch_config["concurrency"] = args.concurrency
 
     if args.email is not None:
         geocode_config["email"] = args.email
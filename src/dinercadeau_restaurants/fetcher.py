@@ -2,28 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
-from typing import Iterable, Iterator, Optional
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional
 
 from .models import ListingPage
 from .settings import FetchSettings, build_listing_url
+from .transport import HTTPClient, RateLimiter, create_async_client, create_client
 
 logger = logging.getLogger(__name__)
 
 
 class DinerCadeauFetcher:
-    """Fetch listing pages using ``requests`` with minimal rate limiting."""
+    """Fetch listing pages with minimal rate limiting."""
 
-    def __init__(self, settings: Optional[FetchSettings] = None) -> None:
+    def __init__(
+        self,
+        settings: Optional[FetchSettings] = None,
+        session: Optional[HTTPClient] = None,
+    ) -> None:
         self.settings = settings or FetchSettings()
-        self._session = requests.Session()
-        self._session.headers.update(self.settings.headers())
+        # An injected session lets callers share one connection pool (and its
+        # warmed TLS state) with other components such as the geocoder.
+        self._session = session or create_client(
+            self.settings.headers(),
+            pool_size=max(self.settings.concurrency, 10),
+        )
+        self._limiter = RateLimiter(self.settings.pause_seconds)
 
     @property
-    def session(self) -> requests.Session:
+    def session(self) -> HTTPClient:
         """Return the HTTP session used to fetch listing pages."""
 
         return self._session
@@ -31,25 +40,66 @@ class DinerCadeauFetcher:
     def fetch(self, page: int) -> ListingPage:
         """Fetch a single listing page and return metadata."""
 
+        self._limiter.wait()
         url = build_listing_url(self.settings, page)
         logger.debug("Fetching page %s", url)
         response = self._session.get(url, timeout=self.settings.request_timeout)
         response.raise_for_status()
-        return ListingPage(url=url, page_number=page, html=response.text)
+        # Keep the undecoded body; the parser consumes bytes directly.
+        return ListingPage(url=url, page_number=page, html=response.content)
 
     def iter_pages(self) -> Iterator[ListingPage]:
-        """Yield listing pages until ``max_pages`` is reached."""
-
-        for page in range(1, self.settings.max_pages + 1):
-            listing = self.fetch(page)
-            yield listing
-            if page < self.settings.max_pages:
-                pause = max(0.0, self.settings.pause_seconds)
-                if pause:
-                    logger.debug("Sleeping %.2f seconds between requests", pause)
-                    time.sleep(pause)
+        """Yield listing pages in order until ``max_pages`` is reached.
+
+        With ``concurrency`` greater than one, pages are fetched in parallel by
+        a thread pool that shares the session's connection pool; the shared
+        rate limiter still enforces the global request rate.
+        """
+
+        pages = range(1, self.settings.max_pages + 1)
+        workers = max(1, self.settings.concurrency)
+        if workers == 1:
+            for page in pages:
+                yield self.fetch(page)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(self.fetch, pages)
 
     def fetch_all(self) -> Iterable[ListingPage]:
         """Convenience wrapper returning a list of listing pages."""
 
         return list(self.iter_pages())
+
+    async def fetch_pages_async(self) -> List[ListingPage]:
+        """Fetch all listing pages concurrently on an asyncio event loop.
+
+        HTTP waits for different pages overlap instead of queueing behind one
+        another; an ``asyncio.Semaphore`` bounds in-flight requests to the
+        configured ``concurrency`` and the shared rate limiter keeps the
+        aggregate request rate identical to the synchronous path.
+        """
+
+        client = create_async_client(self.settings.headers())
+        semaphore = asyncio.Semaphore(max(1, self.settings.concurrency))
+
+        async def _fetch(page: int) -> ListingPage:
+            async with semaphore:
+                await self._limiter.wait_async()
+                url = build_listing_url(self.settings, page)
+                logger.debug("Fetching page %s", url)
+                response = await client.get(url, timeout=self.settings.request_timeout)
+                response.raise_for_status()
+                return ListingPage(url=url, page_number=page, html=response.content)
+
+        try:
+            tasks = [_fetch(page) for page in range(1, self.settings.max_pages + 1)]
+            # return_exceptions lets every sibling task finish before the
+            # client is closed under it; the first failure is re-raised once
+            # all pages have settled.
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return list(results)
+        finally:
+            await client.aclose()
@@ -4,7 +4,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Optional
+from operator import attrgetter
+from typing import Iterable, List, Optional, Tuple
+
+from .settings import DEFAULT_OUTPUT_FIELDS
+
+
+# Printf-style templates for the numeric CSV columns; %-formatting avoids the
+# per-call frame setup of an f-string and keeps the precision in one place.
+_FMT_RATING = "%.2f"
+_FMT_COORD = "%.6f"
+_FMT_DISTANCE = "%.3f"
+
+# The CSV columns are named after Restaurant attributes, so one attrgetter
+# fetches all sixteen values in a single C call instead of sixteen attribute
+# lookups per exported row.
+_ROW_GETTER = attrgetter(*DEFAULT_OUTPUT_FIELDS)
 
 
 @dataclass(slots=True)
@@ -18,7 +33,9 @@ class Restaurant:
     postal_code: Optional[str] = None
     country: str = "Netherlands"
     description: Optional[str] = None
-    tags: List[str] = field(default_factory=list)
+    # A tuple keeps per-object memory down versus a list; most restaurants
+    # carry only a handful of tags and never mutate them after parsing.
+    tags: Tuple[str, ...] = ()
     price_range: Optional[str] = None
     rating: Optional[float] = None
     review_count: Optional[int] = None
@@ -31,33 +48,56 @@ class Restaurant:
     def as_row(self) -> List[str]:
         """Return the restaurant as a CSV row using primitive types."""
 
+        (
+            name,
+            url,
+            city,
+            address,
+            postal_code,
+            country,
+            description,
+            tags,
+            price_range,
+            rating,
+            review_count,
+            latitude,
+            longitude,
+            distance,
+            source,
+            scraped_at,
+        ) = _ROW_GETTER(self)
         return [
-            self.name,
-            self.url,
-            self.city or "",
-            self.address or "",
-            self.postal_code or "",
-            self.country,
-            self.description or "",
-            ";".join(self.tags),
-            self.price_range or "",
-            "" if self.rating is None else f"{self.rating:.2f}",
-            "" if self.review_count is None else str(self.review_count),
-            "" if self.latitude is None else f"{self.latitude:.6f}",
-            "" if self.longitude is None else f"{self.longitude:.6f}",
-            "" if self.distance_km_from_utrecht is None else f"{self.distance_km_from_utrecht:.3f}",
-            self.source,
-            self.scraped_at.isoformat(),
+            name,
+            url,
+            city or "",
+            address or "",
+            postal_code or "",
+            country,
+            description or "",
+            ";".join(tags),
+            price_range or "",
+            "" if rating is None else _FMT_RATING % rating,
+            "" if review_count is None else str(review_count),
+            "" if latitude is None else _FMT_COORD % latitude,
+            "" if longitude is None else _FMT_COORD % longitude,
+            "" if distance is None else _FMT_DISTANCE % distance,
+            source,
+            scraped_at.isoformat(),
         ]
 
 
 @dataclass(slots=True)
 class ListingPage:
-    """Metadata about a listing page that was scraped."""
+    """Metadata about a listing page that was scraped.
+
+    ``html`` holds the raw response body; keeping it as ``bytes`` avoids
+    decoding multi-megabyte pages into ``str`` before the HTML parser (which
+    accepts bytes and sniffs the charset itself) ever sees them.
+    """
 
     url: str
     page_number: int
-    html: str
+    html: bytes
     fetched_at: datetime = field(default_factory=datetime.utcnow)
 
 
@@ -71,19 +111,19 @@ class GeocodeResult:
     raw: dict
 
 
-def merge_tags(*sources: Iterable[str]) -> List[str]:
-    """Return a normalized list of unique tags preserving insertion order."""
+def merge_tags(*sources: Iterable[str]) -> Tuple[str, ...]:
+    """Return a normalized tuple of unique tags preserving insertion order.
+
+    A single insertion-ordered dict keyed on the casefolded tag replaces the
+    former set-plus-list bookkeeping; ``setdefault`` both probes and inserts
+    in one hash lookup, and the first spelling of each tag wins.
+    """
 
-    seen = set()
-    result: List[str] = []
+    seen: dict = {}
+    setdefault = seen.setdefault
     for iterable in sources:
         for tag in iterable:
             normalized = tag.strip()
-            if not normalized:
-                continue
-            lower = normalized.lower()
-            if lower in seen:
-                continue
-            seen.add(lower)
-            result.append(normalized)
-    return result
+            if normalized:
+                setdefault(normalized.casefold(), normalized)
+    return tuple(seen.values())
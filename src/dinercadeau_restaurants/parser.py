@@ -2,37 +2,170 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import re
+import threading
+from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        from selectolax.parser import HTMLParser as _FastHTMLParser  # type: ignore[assignment]
+    except ImportError:
+        _FastHTMLParser = None  # type: ignore[assignment]
 
 from .models import Restaurant, merge_tags
 from .settings import FetchSettings
+from .transport import HTTPClient, create_client
 
 logger = logging.getLogger(__name__)
 
+# Probe once for the lxml backend (libxml2, several times faster than the
+# pure-Python "html.parser") and remember the winner for every soup we build.
+try:
+    BeautifulSoup("", "lxml")
+    _SOUP_FEATURES = "lxml"
+except FeatureNotFound:  # pragma: no cover - depends on installed extras
+    _SOUP_FEATURES = "html.parser"
+
+
+def _make_soup(markup: "str | bytes") -> BeautifulSoup:
+    """Build a soup using the fastest available parser backend.
+
+    Accepts ``bytes`` as delivered by the fetcher so that large response
+    bodies never have to be decoded into an intermediate ``str``. Declaring
+    the encoding up front skips BeautifulSoup's UnicodeDammit charset
+    detection pass; the site serves UTF-8 exclusively.
+    """
+
+    if isinstance(markup, str):
+        markup = markup.encode("utf-8", "replace")
+    return BeautifulSoup(markup, _SOUP_FEATURES, from_encoding="utf-8")
+
+
+#: Restricts tree building to <script> elements; everything this module needs
+#: from the raw page lives in script tags (html5lib aside, BS4 parsers honour
+#: a strainer, roughly halving parse time and memory on listing HTML).
+_SCRIPT_STRAINER = SoupStrainer("script")
+
+
+@functools.lru_cache(maxsize=16)
+def _script_nodes(html: "str | bytes") -> List[Any]:
+    """Parse only the ``<script>`` subtree of ``html`` and return its nodes.
+
+    Memoized on the page content: parse_listing_page can hit this twice for
+    one page (fast path plus Nuxt fallback), and retries re-parse identical
+    HTML. The small ``maxsize`` bounds how many page bodies the cache keeps
+    alive, trading a little memory for skipping repeat parses.
+    """
+
+    if isinstance(html, str):
+        html = html.encode("utf-8", "replace")
+    soup = BeautifulSoup(html, _SOUP_FEATURES, parse_only=_SCRIPT_STRAINER, from_encoding="utf-8")
+    return soup.find_all("script")
+
+
+def _fast_tree(html: "str | bytes") -> Optional[Any]:
+    """Parse ``html`` with selectolax (lexbor, C) when the extra is installed.
+
+    Returns ``None`` when selectolax is unavailable so callers can fall back
+    to the BeautifulSoup tree they already hold.
+    """
+
+    if _FastHTMLParser is None:
+        return None
+    return _FastHTMLParser(html)
+
+
+def _loads(text: "str | bytes") -> Any:
+    """Decode JSON with orjson when available, stdlib ``json`` otherwise.
+
+    orjson is noticeably faster on the large ld+json and Nuxt payloads this
+    module handles; its ``JSONDecodeError`` subclasses the stdlib one, so
+    callers can keep catching ``json.JSONDecodeError``.
+    """
+
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 _DEFAULT_PAGE_SIZE = 50
-_DATASET_CACHE: Dict[str, List[Dict[str, Any]]] = {}
+#: One cached dataset: the immutable row tuple, a lowercased city -> row
+#: positions index so city filtering is a dict lookup instead of a row scan,
+#: and a (city, page) -> entries memo for the slices already served. The memo
+#: lives inside the entry so it is invalidated together with its dataset.
+_DatasetEntry = Tuple[
+    Tuple[Dict[str, Any], ...],
+    Dict[str, Tuple[int, ...]],
+    Dict[Tuple[str, int], List[Dict[str, Any]]],
+]
+_DATASET_CACHE: Dict[str, _DatasetEntry] = {}
 _CHUNK_HASH_CACHE: Dict[str, Dict[int, str]] = {}
 _CONTEXT_CACHE: Dict[str, Dict[str, Tuple[int, int]]] = {}
-_SESSION: Optional[requests.Session] = None
+#: Per-thread fallback clients for when no session is passed in; concurrent
+#: parses must not share one mutable client's state across workers.
+_THREAD_STATE = threading.local()
 
 
 SCRIPT_JSON_RE = re.compile(r"window\.__NUXT__\s*=\s*(\{.*\})", re.DOTALL)
 
-
-def _iter_ld_json(soup: BeautifulSoup) -> Iterator[dict]:
-    for node in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        text = node.string
+_JS_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+_JS_SIMPLE_ESCAPES = {
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+    "0": "\0",
+    "\n": "",  # line continuation
+}
+
+# Asset markers used by _discover_asset_urls. Plain fixed-substring tests via
+# ``in`` compile to one C-level scan, which beats a regex search for literal
+# patterns, so these stay strings rather than compiled patterns.
+_WEBPACK_SRC_MARKER = "static/chunks/webpack-"
+# Tag-strip and whitespace-collapse patterns for the _extract_description
+# fast path that avoids building a soup per restaurant.
+_INLINE_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_PAGE_SRC_MARKER = "static/chunks/pages/%5Blayout%5D/%5B%5B...slug%5D%5D"
+
+# Key sets used by the candidate filters, hoisted so the hot per-entry checks
+# reuse one frozenset instead of rebuilding literal tuples on every call.
+_LD_JSON_TYPES = frozenset({"Restaurant", "FoodEstablishment"})
+_URL_KEYS = frozenset({"slug", "url", "link", "permalink"})
+_LOCATION_KEYS = frozenset({"address", "location", "city", "plaats"})
+_TAG_KEYS = ("categories", "labels", "tags", "cuisines")
+
+
+def _iter_ld_json(tree: Optional[Any], scripts: Sequence[Any]) -> Iterator[dict]:
+    if tree is not None:
+        # The selectolax CSS engine extracts the blocks without touching the
+        # (much slower) BS4 tree at all.
+        texts: Iterable[Optional[str]] = (
+            node.text() for node in tree.css('script[type="application/ld+json"]')
+        )
+    else:
+        texts = (node.string for node in scripts if node.get("type") == "application/ld+json")
+    for text in texts:
         if not text:
             continue
         try:
-            data = json.loads(text)
+            data = _loads(text)
         except json.JSONDecodeError:
             logger.debug("Failed to decode ld+json block", exc_info=True)
             continue
@@ -72,45 +205,47 @@ def _parse_offer(data: dict) -> tuple[Optional[str], Optional[str]]:
 
 
 def _extract_from_ld_json(data: dict) -> Optional[Restaurant]:
-    if data.get("@type") not in {"Restaurant", "FoodEstablishment"}:
+    get = data.get
+    if get("@type") not in _LD_JSON_TYPES:
         return None
-    name = data.get("name")
+    name = get("name")
     if not name:
         return None
-    url = data.get("url") or data.get("@id")
+    url = get("url") or get("@id")
     if not url:
         return None
-    address_data = data.get("address") or {}
+    address_data = get("address") or {}
     if isinstance(address_data, list) and address_data:
         address_data = address_data[0]
     if not isinstance(address_data, dict):
         address_data = {}
 
-    description = data.get("description") or data.get("disambiguatingDescription")
+    description = get("description") or get("disambiguatingDescription")
     rating_value, review_count = _parse_rating(data)
     price_range, _ = _parse_offer(data)
 
     tags = []
-    cuisines = data.get("servesCuisine")
+    cuisines = get("servesCuisine")
     if isinstance(cuisines, str):
         tags.append(cuisines)
     elif isinstance(cuisines, list):
         tags.extend(str(item) for item in cuisines)
 
+    address_get = address_data.get
     return Restaurant(
         name=name,
         url=url,
-        city=address_data.get("addressLocality"),
-        address=address_data.get("streetAddress"),
-        postal_code=address_data.get("postalCode"),
-        country=address_data.get("addressCountry") or "Netherlands",
+        city=address_get("addressLocality"),
+        address=address_get("streetAddress"),
+        postal_code=address_get("postalCode"),
+        country=address_get("addressCountry") or "Netherlands",
         description=description,
-        tags=merge_tags(tags, [data.get("@type", ""), data.get("category", "")]),
-        price_range=price_range or data.get("priceRange"),
+        tags=merge_tags(tags, [get("@type", ""), get("category", "")]),
+        price_range=price_range or get("priceRange"),
         rating=rating_value,
         review_count=review_count,
-        latitude=_safe_float(data.get("latitude")),
-        longitude=_safe_float(data.get("longitude")),
+        latitude=_safe_float(get("latitude")),
+        longitude=_safe_float(get("longitude")),
     )
 
 
@@ -122,12 +257,12 @@ def _safe_float(value: object) -> Optional[float]:
 
 
 def parse_listing_page(
-    html: str,
+    html: "str | bytes",
     *,
     city: Optional[str] = None,
     page_number: Optional[int] = None,
     page_url: Optional[str] = None,
-    session: Optional[requests.Session] = None,
+    session: Optional[HTTPClient] = None,
 ) -> List[Restaurant]:
     """Parse a single listing page into restaurant entries.
 
@@ -138,13 +273,19 @@ def parse_listing_page(
     remain as a defensive fallback.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
+    tree = _fast_tree(html)
     base_url = _infer_base_url(page_url)
+    # With selectolax available the C tree serves all script lookups and the
+    # (far costlier) BS4 tree is never built on the happy path; otherwise a
+    # single find_all pass feeds asset discovery and both fallbacks.
+    scripts: Sequence[Any] = ()
+    if tree is None:
+        scripts = _script_nodes(html)
 
     restaurants: List[Restaurant] = []
     try:
         http = _ensure_session(session)
-        dataset = _load_dc_live_dataset(soup, base_url, http)
+        dataset = _load_dc_live_dataset(tree, scripts, base_url, http)
     except Exception:  # pragma: no cover - defensive fallback
         logger.debug("Falling back to legacy parsers", exc_info=True)
     else:
@@ -154,7 +295,7 @@ def parse_listing_page(
         return restaurants
 
     # Legacy fallback: ld+json and embedded payloads.
-    for data in _iter_ld_json(soup):
+    for data in _iter_ld_json(tree, scripts):
         restaurant = _extract_from_ld_json(data)
         if restaurant:
             restaurants.append(restaurant)
@@ -164,7 +305,11 @@ def parse_listing_page(
         return restaurants
 
     seen_urls: set[str] = set()
-    for payload in _iter_script_payloads(soup):
+    if tree is not None and not scripts:
+        # The Nuxt fallback needs BS4 node accessors; build the soup lazily,
+        # only when both faster extraction paths came up empty.
+        scripts = _script_nodes(html)
+    for payload in _iter_script_payloads(scripts):
         for restaurant in _parse_nuxt_payload(payload):
             if restaurant.url and restaurant.url not in seen_urls:
                 restaurants.append(restaurant)
@@ -173,44 +318,106 @@ def parse_listing_page(
     return restaurants
 
 
-def _ensure_session(session: Optional[requests.Session]) -> requests.Session:
+@functools.lru_cache(maxsize=1)
+def _default_settings() -> FetchSettings:
+    """Return the shared default ``FetchSettings`` used by module helpers.
+
+    The helpers below only read defaults from it, so one instance (and its
+    cached headers) serves every chunk fetch instead of constructing a fresh
+    dataclass per call in the hot loop.
+    """
+
+    return FetchSettings()
+
+
+def _ensure_session(session: Optional[HTTPClient]) -> HTTPClient:
     if session is not None:
         return session
-    global _SESSION
-    if _SESSION is None:
-        _SESSION = requests.Session()
-        _SESSION.headers.update(FetchSettings().headers())
-    return _SESSION
+    client = getattr(_THREAD_STATE, "session", None)
+    if client is None:
+        # HTTP/2 multiplexing (when httpx is installed) lets the page-chunk,
+        # webpack and dataset fetches reuse one connection and TLS handshake.
+        # One lazily built client per thread keeps concurrent scrapers from
+        # stomping on each other's connection and header state.
+        client = create_client(_default_settings().headers())
+        _THREAD_STATE.session = client
+    return client
 
 
 def _infer_base_url(page_url: Optional[str]) -> str:
     if not page_url:
-        return FetchSettings().base_url
+        return _default_settings().base_url
     parsed = urlparse(page_url)
     if not parsed.scheme or not parsed.netloc:
-        return FetchSettings().base_url
+        return _default_settings().base_url
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
+def _fast_join(base: str, path: str) -> str:
+    """Join ``path`` onto a scheme+host ``base`` without a full URL parse.
+
+    Every base in this module is ``scheme://netloc`` (see ``_infer_base_url``)
+    and nearly every path is root-relative, so plain concatenation replaces
+    ``urljoin``'s parse/normalize round-trip in the per-row hot path. Anything
+    else falls back to ``urljoin`` for correctness.
+    """
+
+    if path.startswith("http"):
+        return path
+    # Protocol-relative paths ("//cdn...") must resolve against the scheme,
+    # not the host, so they take the fallback with everything else unusual.
+    if path.startswith("/") and not path.startswith("//"):
+        return base.rstrip("/") + path
+    return urljoin(base, path)
+
+
+def _build_city_index(rows: Tuple[Dict[str, Any], ...]) -> Dict[str, Tuple[int, ...]]:
+    """Map each lowercased city to the positions of its rows, in order.
+
+    Built once per dataset so every subsequent ``_filter_dataset`` call pays
+    one dict lookup instead of normalizing the city of every row again.
+    """
+
+    index: Dict[str, List[int]] = {}
+    for position, entry in enumerate(rows):
+        index.setdefault((entry.get("city") or "").strip().lower(), []).append(position)
+    return {city: tuple(positions) for city, positions in index.items()}
+
+
 def _filter_dataset(
-    dataset: List[Dict[str, Any]],
+    dataset: _DatasetEntry,
     *,
     city: Optional[str],
     page_number: Optional[int],
 ) -> List[Dict[str, Any]]:
-    entries = dataset
-    if city:
-        target = city.strip().lower()
-        entries = [entry for entry in entries if (entry_city := (entry.get("city") or "").strip().lower()) == target]
+    rows, city_index, page_cache = dataset
+    target = city.strip().lower() if city else ""
+    cache_key = (target, page_number or 0)
+    cached = page_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    positions: "Sequence[int]"
+    if target:
+        positions = city_index.get(target, ())
+    else:
+        positions = range(len(rows))
     if page_number and page_number > 0:
         start = (page_number - 1) * _DEFAULT_PAGE_SIZE
-        end = start + _DEFAULT_PAGE_SIZE
-        entries = entries[start:end]
+        positions = positions[start : start + _DEFAULT_PAGE_SIZE]
+    # Only the rows the page actually returns are ever touched; a scraper
+    # revisiting a (city, page) pair gets the memoized slice back outright.
+    entries = [rows[position] for position in positions]
+    page_cache[cache_key] = entries
     return entries
 
 
-def _load_dc_live_dataset(soup: BeautifulSoup, base_url: str, session: requests.Session) -> List[Dict[str, Any]]:
-    page_chunk_url, webpack_url = _discover_asset_urls(soup, base_url)
+def _load_dc_live_dataset(
+    tree: Optional[Any],
+    scripts: Sequence[Any],
+    base_url: str,
+    session: HTTPClient,
+) -> _DatasetEntry:
+    page_chunk_url, webpack_url = _discover_asset_urls(tree, scripts, base_url)
     if page_chunk_url in _DATASET_CACHE:
         return _DATASET_CACHE[page_chunk_url]
 
@@ -225,22 +432,30 @@ def _load_dc_live_dataset(soup: BeautifulSoup, base_url: str, session: requests.
     if not chunk_hash:
         raise ValueError(f"Chunk hash missing for dataset chunk {chunk_id}")
 
-    chunk_url = urljoin(base_url, f"/_next/static/chunks/{chunk_id}.{chunk_hash}.js")
+    chunk_url = _fast_join(base_url, f"/_next/static/chunks/{chunk_id}.{chunk_hash}.js")
     chunk_source = _fetch_text(chunk_url, session)
-    dataset = _parse_dataset_chunk(chunk_source, module_id)
-    _DATASET_CACHE[page_chunk_url] = dataset
-    return dataset
+    rows = tuple(_parse_dataset_chunk(chunk_source, module_id))
+    cached = (rows, _build_city_index(rows), {})
+    _DATASET_CACHE[page_chunk_url] = cached
+    return cached
 
 
-def _discover_asset_urls(soup: BeautifulSoup, base_url: str) -> Tuple[str, str]:
+def _discover_asset_urls(tree: Optional[Any], scripts: Sequence[Any], base_url: str) -> Tuple[str, str]:
     webpack_url: Optional[str] = None
     page_chunk_url: Optional[str] = None
-    for script in soup.find_all("script", src=True):
-        src = script["src"]
-        if "static/chunks/webpack-" in src:
-            webpack_url = urljoin(base_url, src)
-        elif "static/chunks/pages/%5Blayout%5D/%5B%5B...slug%5D%5D" in src:
-            page_chunk_url = urljoin(base_url, src)
+    if tree is not None:
+        srcs: Iterable[Optional[str]] = (
+            node.attributes.get("src") for node in tree.css("script[src]")
+        )
+    else:
+        srcs = (script.get("src") for script in scripts)
+    for src in srcs:
+        if not src:
+            continue
+        if _WEBPACK_SRC_MARKER in src:
+            webpack_url = _fast_join(base_url, src)
+        elif _PAGE_SRC_MARKER in src:
+            page_chunk_url = _fast_join(base_url, src)
         if webpack_url and page_chunk_url:
             break
     if not webpack_url or not page_chunk_url:
@@ -248,7 +463,51 @@ def _discover_asset_urls(soup: BeautifulSoup, base_url: str) -> Tuple[str, str]:
     return page_chunk_url, webpack_url
 
 
-def _load_dataset_context(page_chunk_url: str, session: requests.Session) -> Dict[str, Tuple[int, int]]:
+def _find_matching_brace(source: str, open_index: int) -> int:
+    """Return the index of the ``}`` closing the object opened at ``open_index``.
+
+    Jumps between braces and quotes with ``str.find`` (a C-level substring
+    scan) instead of visiting every character, so the cost scales with the
+    number of structural tokens rather than the length of a multi-megabyte
+    bundle. Double-quoted string bodies are skipped wholesale, so braces
+    inside values (descriptions, URLs) can never unbalance the walk.
+    """
+
+    find = source.find
+    depth = 0
+    index = open_index
+    while True:
+        next_open = find("{", index)
+        next_close = find("}", index)
+        next_quote = find('"', index)
+        if next_close == -1:
+            return -1
+        if next_quote != -1 and next_quote < next_close and (next_open == -1 or next_quote < next_open):
+            # Jump over the string literal, honouring escaped quotes.
+            end = next_quote
+            while True:
+                end = find('"', end + 1)
+                if end == -1:
+                    return -1
+                backslashes = 0
+                probe = end - 1
+                while source[probe] == "\\":
+                    backslashes += 1
+                    probe -= 1
+                if backslashes % 2 == 0:
+                    break
+            index = end + 1
+        elif next_open != -1 and next_open < next_close:
+            depth += 1
+            index = next_open + 1
+        else:
+            depth -= 1
+            index = next_close + 1
+            if depth == 0:
+                return next_close
+
+
+def _load_dataset_context(page_chunk_url: str, session: HTTPClient) -> Dict[str, Tuple[int, int]]:
     if page_chunk_url in _CONTEXT_CACHE:
         return _CONTEXT_CACHE[page_chunk_url]
     source = _fetch_text(page_chunk_url, session)
@@ -256,29 +515,17 @@ def _load_dataset_context(page_chunk_url: str, session: requests.Session) -> Dic
     marker_index = source.find(target)
     if marker_index == -1:
         raise ValueError("Dataset context block not found in page chunk")
-    brace_count = 0
-    index = marker_index
-    end_index = -1
-    while index < len(source):
-        char = source[index]
-        if char == "{":
-            brace_count += 1
-        elif char == "}":
-            brace_count -= 1
-            if brace_count == 0:
-                end_index = index
-                break
-        index += 1
+    end_index = _find_matching_brace(source, marker_index)
     if end_index == -1:
         raise ValueError("Dataset context object boundaries not determined")
     context_fragment = source[marker_index : end_index + 1]
-    context_data = json.loads(context_fragment)
+    context_data = _loads(context_fragment)
     context_map = {key: (value[0], value[1]) for key, value in context_data.items()}
     _CONTEXT_CACHE[page_chunk_url] = context_map
     return context_map
 
 
-def _load_chunk_hashes(webpack_url: str, session: requests.Session) -> Dict[int, str]:
+def _load_chunk_hashes(webpack_url: str, session: HTTPClient) -> Dict[int, str]:
     if webpack_url in _CHUNK_HASH_CACHE:
         return _CHUNK_HASH_CACHE[webpack_url]
     source = _fetch_text(webpack_url, session)
@@ -289,19 +536,7 @@ def _load_chunk_hashes(webpack_url: str, session: requests.Session) -> Dict[int,
     brace_start = source.find("{", prefix_index)
     if brace_start == -1:
         raise ValueError("Chunk hash object start not found")
-    brace_count = 0
-    index = brace_start
-    end_index = -1
-    while index < len(source):
-        char = source[index]
-        if char == "{":
-            brace_count += 1
-        elif char == "}":
-            brace_count -= 1
-            if brace_count == 0:
-                end_index = index
-                break
-        index += 1
+    end_index = _find_matching_brace(source, brace_start)
     if end_index == -1:
         raise ValueError("Chunk hash object boundaries not determined")
     mapping_text = source[brace_start + 1 : end_index]
@@ -319,10 +554,53 @@ def _load_chunk_hashes(webpack_url: str, session: requests.Session) -> Dict[int,
     return mapping
 
 
-def _fetch_text(url: str, session: requests.Session) -> str:
-    response = session.get(url, timeout=FetchSettings().request_timeout)
+#: On-disk cache for fetched bundle text; the in-process caches above die with
+#: the interpreter, so CLI runs would otherwise re-download the multi-megabyte
+#: webpack assets on every invocation.
+_FETCH_CACHE_DIR = Path.home() / ".cache" / "dinercadeau"
+
+
+def _fetch_cache_file(url: str) -> Path:
+    return _FETCH_CACHE_DIR / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_fetch_cache(url: str) -> Optional[Dict[str, str]]:
+    try:
+        cached = _loads(_fetch_cache_file(url).read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if isinstance(cached, dict) and "etag" in cached and "body" in cached:
+        return cached
+    return None
+
+
+def _write_fetch_cache(url: str, etag: str, body: str) -> None:
+    try:
+        _FETCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _fetch_cache_file(url).write_text(json.dumps({"etag": etag, "body": body}), encoding="utf-8")
+    except OSError:
+        logger.warning("Could not persist fetch cache for %s", url)
+
+
+def _fetch_text(url: str, session: HTTPClient) -> str:
+    """Fetch ``url``, revalidating a persisted copy with ``If-None-Match``.
+
+    When the server still advertises the stored ETag it answers 304 without a
+    body, so unchanged bundles cost one header round-trip across process
+    restarts instead of a full download and reparse.
+    """
+
+    cached = _read_fetch_cache(url)
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    response = session.get(url, timeout=_default_settings().request_timeout, headers=headers)
+    if cached is not None and response.status_code == 304:
+        return cached["body"]
     response.raise_for_status()
-    return response.text
+    text = response.text
+    etag = response.headers.get("ETag")
+    if etag:
+        _write_fetch_cache(url, etag, text)
+    return text
 
 
 def _parse_dataset_chunk(source: str, module_id: int) -> List[Dict[str, Any]]:
@@ -340,30 +618,56 @@ def _parse_dataset_chunk(source: str, module_id: int) -> List[Dict[str, Any]]:
     if quote not in {"'", '"'}:
         raise ValueError("Unexpected string delimiter in dataset chunk")
     raw_json, _ = _extract_js_string(source, literal_start, quote)
-    json_text = bytes(raw_json, "utf-8").decode("unicode_escape")
-    data = json.loads(json_text)
+    data = _loads(_unescape_js_string(raw_json))
     if not isinstance(data, list):
         raise ValueError("Dataset payload was not a list")
     return data  # type: ignore[return-value]
 
 
+def _unescape_js_string(raw: str) -> str:
+    """Resolve JavaScript string escapes into the JSON text they encode.
+
+    The old ``bytes(raw, "utf-8").decode("unicode_escape")`` round-trip
+    materialized two extra copies of the multi-megabyte dataset literal and
+    silently mangled non-ASCII characters (unicode_escape assumes latin-1).
+    A single regex substitution touches only the escape sequences instead.
+    ``\\uXXXX`` sequences are left intact on purpose: they are valid JSON
+    escapes, so the JSON decoder resolves them (including surrogate pairs).
+    """
+
+    def _replace(match: "re.Match[str]") -> str:
+        token = match.group(1)
+        first = token[0]
+        if first == "u" and len(token) == 5:
+            return match.group(0)
+        if first == "x" and len(token) == 3:
+            return chr(int(token[1:], 16))
+        return _JS_SIMPLE_ESCAPES.get(token, token)
+
+    return _JS_ESCAPE_RE.sub(_replace, raw)
+
+
+# String-body scanners for _extract_js_string: everything up to the first
+# unescaped terminator, with escapes consumed via the `\\.` alternative.
+_JS_DQ_BODY = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+_JS_SQ_BODY = re.compile(r"(?:[^'\\]|\\.)*", re.DOTALL)
+
+
 def _extract_js_string(source: str, start: int, quote: str) -> Tuple[str, int]:
-    buffer: List[str] = []
-    index = start + 1
-    length = len(source)
-    while index < length:
-        char = source[index]
-        if char == quote:
-            backslashes = 0
-            lookbehind = index - 1
-            while lookbehind >= start and source[lookbehind] == "\\":
-                backslashes += 1
-                lookbehind -= 1
-            if backslashes % 2 == 0:
-                return "".join(buffer), index
-        buffer.append(char)
-        index += 1
-    raise ValueError("Unterminated JavaScript string literal")
+    """Return the body of the string literal opening at ``start`` and the
+    index of its closing quote.
+
+    A single C-level regex match replaces the former character-by-character
+    walk (with its backslash-counting lookbehind per quote candidate), which
+    dominated runtime on the multi-megabyte dataset literal.
+    """
+
+    body = _JS_DQ_BODY if quote == '"' else _JS_SQ_BODY
+    match = body.match(source, start + 1)
+    end = match.end()
+    if end >= len(source) or source[end] != quote:
+        raise ValueError("Unterminated JavaScript string literal")
+    return match.group(0), end
 
 
 def _convert_entry(entry: Dict[str, Any], base_url: str) -> Optional[Restaurant]:
@@ -371,7 +675,7 @@ def _convert_entry(entry: Dict[str, Any], base_url: str) -> Optional[Restaurant]
     link = entry.get("linkHref")
     if not title or not link:
         return None
-    url = urljoin(base_url, link)
+    url = _fast_join(base_url, link)
     description = _extract_description(entry)
     website = entry.get("websiteLinkHref")
     tag_sources: List[Iterable[str]] = []
@@ -381,7 +685,7 @@ def _convert_entry(entry: Dict[str, Any], base_url: str) -> Optional[Restaurant]
     region = entry.get("region")
     if isinstance(region, str):
         tag_sources.append([region])
-    meta_tags = _coerce_tags(entry.get("metaData"))
+    meta_tags = _flatten_tags(entry.get("metaData"))
     if meta_tags:
         tag_sources.append(meta_tags)
     if isinstance(website, str):
@@ -428,44 +732,82 @@ def _extract_description(entry: Dict[str, Any]) -> Optional[str]:
     if not fragments:
         return None
     html = "\n".join(fragments)
-    soup = BeautifulSoup(html, "html.parser")
+    # Nuxt content nodes are almost always plain text; joining them directly
+    # (and regex-stripping the odd inline tag) spares a soup construction per
+    # restaurant. BS4 remains the fallback for markup the regex mangles.
+    if "<" not in html:
+        text_content = " ".join(fragment.strip() for fragment in fragments if fragment.strip())
+        return text_content or None
+    stripped = _WHITESPACE_RE.sub(" ", _INLINE_TAG_RE.sub(" ", html)).strip()
+    if stripped and "<" not in stripped:
+        return stripped
+    soup = _make_soup(html)
     text_content = soup.get_text(" ", strip=True)
     return text_content or None
 
 
-def _coerce_tags(value: Any) -> List[str]:
-    if value is None:
-        return []
-    if isinstance(value, str):
-        return [value]
-    if isinstance(value, dict):
-        return [str(item) for item in value.values() if isinstance(item, str)]
-    if isinstance(value, (list, tuple, set)):
-        tags: List[str] = []
-        for item in value:
-            tags.extend(_coerce_tags(item))
-        return tags
-    return [str(value)]
+def _flatten_tags(*values: Any) -> List[str]:
+    """Flatten arbitrarily nested tag values into a flat list of strings.
 
+    One explicit-stack walk replaces the overlapping recursive ``_coerce_tags``
+    and ``_normalize_iterable`` helpers, so each restaurant entry pays a single
+    call and one isinstance dispatch per node. Strings pass through, containers
+    are descended into, remaining scalars are stringified and ``None`` values
+    are dropped.
+    """
+
+    tags: List[str] = []
+    stack: List[Any] = list(reversed(values))
+    while stack:
+        value = stack.pop()
+        if value is None:
+            continue
+        if isinstance(value, str):
+            tags.append(value)
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, (list, tuple, set)):
+            stack.extend(reversed(list(value)))
+        else:
+            tags.append(str(value))
+    return tags
+
+
+def _could_hold_restaurants(text: str) -> bool:
+    """Cheap pre-filter before decoding a script payload.
 
-def _iter_script_payloads(soup: BeautifulSoup) -> Iterator[Any]:
-    for script in soup.find_all("script"):
+    Every candidate dict must carry a ``name`` or ``title`` key, so a payload
+    whose raw JSON contains neither substring cannot produce restaurants and
+    is not worth decoding. The substring scans run at C speed and spare us
+    multi-megabyte JSON decodes of unrelated bootstrap data.
+    """
+
+    return '"name"' in text or '"title"' in text
+
+
+def _iter_script_payloads(scripts: Sequence[Any]) -> Iterator[Any]:
+    for script in scripts:
         text = script.string or script.get_text()
         if not text:
             continue
 
         data: Any = None
         if script.get("type") == "application/json":
+            if not _could_hold_restaurants(text):
+                continue
             try:
-                data = json.loads(text)
+                data = _loads(text)
             except json.JSONDecodeError:
                 logger.debug("Failed to decode JSON script block", exc_info=True)
                 continue
         else:
             match = SCRIPT_JSON_RE.search(text)
             if match:
+                payload = match.group(1)
+                if not _could_hold_restaurants(payload):
+                    continue
                 try:
-                    data = json.loads(match.group(1))
+                    data = _loads(payload)
                 except json.JSONDecodeError:
                     logger.debug("Failed to decode window.__NUXT__ payload", exc_info=True)
                     continue
@@ -486,8 +828,21 @@ def _parse_nuxt_payload(payload: Any) -> Iterable[Restaurant]:
     return results
 
 
+#: Container types worth descending into while scanning the Nuxt payload.
+_CONTAINER_TYPES = (dict, list, tuple, set)
+
+
 def _iter_candidate_dicts(payload: Any) -> Iterator[Dict[str, Any]]:
-    stack: List[Any] = [payload]
+    """Yield restaurant-like dicts from an arbitrarily nested payload.
+
+    The traversal only ever pushes containers onto the stack: scalars are
+    filtered out while batching children, which avoids one push/pop/isinstance
+    round-trip per leaf value on payloads that are overwhelmingly scalar.
+    Image/asset dicts — a large share of a Nuxt payload — are pruned outright
+    since nothing restaurant-like nests below them.
+    """
+
+    stack: List[Any] = [payload] if isinstance(payload, _CONTAINER_TYPES) else []
     seen: set[int] = set()
 
     while stack:
@@ -497,77 +852,70 @@ def _iter_candidate_dicts(payload: Any) -> Iterator[Dict[str, Any]]:
             if ident in seen:
                 continue
             seen.add(ident)
-            if _looks_like_restaurant(current):
+            if "src" in current and ("width" in current or "srcset" in current):
+                # Media node: skip both the restaurant check and the subtree.
+                continue
+            # A restaurant entry carries at least a name/title, a URL-ish key
+            # and a location-ish key; smaller dicts are wrappers worth
+            # descending into but never worth the key-intersection check.
+            if len(current) >= 3 and _looks_like_restaurant(current):
                 yield current
-            stack.extend(current.values())
-        elif isinstance(current, (list, tuple, set)):
-            stack.extend(current)
+            stack += [value for value in current.values() if isinstance(value, _CONTAINER_TYPES)]
+        else:
+            stack += [item for item in current if isinstance(item, _CONTAINER_TYPES)]
 
 
 def _looks_like_restaurant(entry: Dict[str, Any]) -> bool:
-    name = entry.get("name") or entry.get("title")
-    if not name:
-        return False
-    if not any(key in entry for key in ("slug", "url", "link", "permalink")):
+    if not (entry.get("name") or entry.get("title")):
         return False
-    if not any(key in entry for key in ("address", "location", "city", "plaats")):
-        return False
-    return True
+    # dict keys views intersect with frozensets in a single C call, replacing
+    # the per-key membership loops this check used to run.
+    keys = entry.keys()
+    return bool(keys & _URL_KEYS) and bool(keys & _LOCATION_KEYS)
 
 
 def _convert_candidate(entry: Dict[str, Any]) -> Optional[Restaurant]:
-    name = entry.get("name") or entry.get("title")
+    # Bind the bound methods once; this function runs for every candidate in
+    # a payload and each entry.get(...) otherwise repeats the method lookup.
+    get = entry.get
+    name = get("name") or get("title")
     if not name:
         return None
 
-    url = entry.get("url") or entry.get("permalink") or entry.get("link") or entry.get("slug")
+    url = get("url") or get("permalink") or get("link") or get("slug")
     if url:
         if isinstance(url, dict):
             url = url.get("href") or url.get("url")
         if isinstance(url, Sequence) and not isinstance(url, (str, bytes)):
             url = next((item for item in url if isinstance(item, str)), None)
     if isinstance(url, str) and not url.startswith("http"):
-        url = urljoin("https://www.diner-cadeau.nl", url)
+        url = _fast_join("https://www.diner-cadeau.nl", url)
 
-    description = entry.get("excerpt") or entry.get("description") or entry.get("intro")
+    description = get("excerpt") or get("description") or get("intro")
 
-    tags_source: List[str] = []
-    for key in ("categories", "labels", "tags", "cuisines"):
-        value = entry.get(key)
-        tags_source.extend(_normalize_iterable(value))
+    tags_source = _flatten_tags(*(get(key) for key in _TAG_KEYS))
 
-    rating = entry.get("rating") or entry.get("score") or entry.get("averageRating")
-    review_count = entry.get("reviews") or entry.get("review_count") or entry.get("ratingCount")
+    rating = get("rating") or get("score") or get("averageRating")
+    review_count = get("reviews") or get("review_count") or get("ratingCount")
 
     location = _coerce_location(entry)
+    loc_get = location.get
 
     return Restaurant(
         name=name,
         url=url or "",
-        city=location.get("city") or location.get("plaats"),
-        address=location.get("address") or location.get("street") or location.get("streetAddress"),
-        postal_code=location.get("postal_code") or location.get("postalCode") or location.get("zip") or location.get("zipcode"),
+        city=loc_get("city") or loc_get("plaats"),
+        address=loc_get("address") or loc_get("street") or loc_get("streetAddress"),
+        postal_code=loc_get("postal_code") or loc_get("postalCode") or loc_get("zip") or loc_get("zipcode"),
         description=description,
         tags=merge_tags(tags_source),
         rating=_safe_float(rating),
         review_count=_safe_int(review_count),
-        latitude=_safe_float(location.get("lat") or location.get("latitude")),
-        longitude=_safe_float(location.get("lng") or location.get("longitude")),
+        latitude=_safe_float(loc_get("lat") or loc_get("latitude")),
+        longitude=_safe_float(loc_get("lng") or loc_get("longitude")),
     )
 
 
-def _normalize_iterable(value: Any) -> List[str]:
-    if value is None:
-        return []
-    if isinstance(value, dict):
-        return [str(item) for item in value.values()]
-    if isinstance(value, (list, tuple, set)):
-        return [str(item) for item in value]
-    if isinstance(value, str):
-        return [value]
-    return [str(value)]
-
-
 def _coerce_location(entry: Dict[str, Any]) -> Dict[str, Any]:
     location = entry.get("location") or entry.get("address") or {}
     if isinstance(location, list) and location:
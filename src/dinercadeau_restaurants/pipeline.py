@@ -2,20 +2,39 @@
 
 from __future__ import annotations
 
-import csv
 import logging
-from collections import OrderedDict
+import re
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, TextIO
 
 from .fetcher import DinerCadeauFetcher
-from .geocode import NominatimGeocoder, annotate_with_coordinates, compute_distance_to_utrecht
 from .models import Restaurant
 from .parser import parse_listing_page
 from .settings import PipelineSettings, default_output_fields
 
 logger = logging.getLogger(__name__)
 
+#: Rows handed to the CSV writer per batch when exporting.
+_CSV_CHUNK_ROWS = 1000
+
+# Characters that force a field to be quoted when writing CSV.
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
+
+def _escape_csv_field(field: str) -> str:
+    """Quote ``field`` exactly as ``csv.writer`` (QUOTE_MINIMAL) would.
+
+    Fields without delimiters, quotes or newlines — the overwhelming majority
+    of exported values — pass through untouched after one C-level regex scan.
+    """
+
+    if _CSV_SPECIAL_RE.search(field):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
 
 def run_pipeline(settings: Optional[PipelineSettings] = None) -> List[Restaurant]:
     """Run the scraping pipeline using the provided settings."""
@@ -23,7 +42,13 @@ def run_pipeline(settings: Optional[PipelineSettings] = None) -> List[Restaurant
     settings = settings or PipelineSettings()
     fetcher = DinerCadeauFetcher(settings.fetch)
 
-    restaurants: List[Restaurant] = []
+    # Restaurants are deduplicated as pages stream in: one insertion-ordered
+    # dict keyed like deduplicate_restaurants keeps memory proportional to the
+    # unique count instead of materializing every page before a second pass.
+    seen: Dict[str, Restaurant] = {}
+    # Evaluated once: skips the log call (and its argument tuple) per page
+    # when INFO is disabled for the whole crawl.
+    log_info = logger.isEnabledFor(logging.INFO)
     for page in fetcher.iter_pages():
         parsed = parse_listing_page(
             page.html,
@@ -32,41 +57,99 @@ def run_pipeline(settings: Optional[PipelineSettings] = None) -> List[Restaurant
             page_url=page.url,
             session=fetcher.session,
         )
-        logger.info("Parsed %d restaurants from %s", len(parsed), page.url)
-        restaurants.extend(parsed)
+        if log_info:
+            logger.info("Parsed %d restaurants from %s", len(parsed), page.url)
+        for restaurant in parsed:
+            key = restaurant.url.strip().lower() if restaurant.url else restaurant.name.lower()
+            seen.setdefault(key, restaurant)
 
-    restaurants = deduplicate_restaurants(restaurants)
+    restaurants = list(seen.values())
     logger.info("Retained %d unique restaurants after de-duplication", len(restaurants))
 
+    # One timestamp per batch: every row in a run shares the same scrape time,
+    # so there is no need to take a datetime.utcnow() per restaurant.
+    scraped_at = datetime.utcnow()
+    for restaurant in restaurants:
+        restaurant.scraped_at = scraped_at
+
+    # Imported lazily so `import dinercadeau_restaurants.pipeline` (and CLI
+    # startup) skips geopy/NumPy until a run actually needs them.
+    from .geocode import compute_distance_to_utrecht
+
     if settings.include_geocoding:
-        geocoder = NominatimGeocoder(settings.geocode)
+        from .geocode import NominatimGeocoder, RoundRobinGeocoder, annotate_with_coordinates
+
+        # Reuse the fetcher's client so geocoding rides the same connection
+        # pool instead of opening a second one with cold TLS state.
+        if settings.geocode.provider_urls:
+            geocoder = RoundRobinGeocoder(settings.geocode, session=fetcher.session)
+        else:
+            geocoder = NominatimGeocoder(settings.geocode, session=fetcher.session)
         annotate_with_coordinates(restaurants, geocoder=geocoder)
 
     compute_distance_to_utrecht(restaurants)
 
     if settings.output_csv:
-        write_to_csv(restaurants, settings.output_csv, append=settings.append)
+        write_to_csv(
+            restaurants,
+            settings.output_csv,
+            append=settings.append,
+            chunk_rows=settings.csv_chunk_rows,
+        )
 
     return restaurants
 
 
-def write_to_csv(restaurants: Iterable[Restaurant], path: str | Path, append: bool = False) -> None:
-    """Persist restaurants to CSV."""
-
+def write_to_csv(
+    restaurants: Iterable[Restaurant],
+    path: str | Path,
+    append: bool = False,
+    handle: Optional[TextIO] = None,
+    chunk_rows: int = _CSV_CHUNK_ROWS,
+) -> None:
+    """Persist restaurants to CSV.
+
+    When ``handle`` is given the caller manages the file's lifecycle and the
+    function writes to it directly; repeated fragment writes then skip the
+    per-call ``stat()``/open/close round-trip, and a header is only emitted
+    for non-append writes.
+
+    Rows stream through the writer in batches of ``chunk_rows``, with one
+    flush per batch: memory stays bounded for arbitrarily large crawls and a
+    crash mid-export loses at most the current batch.
+    """
+
+    # islice with a non-positive size would end the loop before the first
+    # row, silently exporting nothing; clamp rather than lose the data.
+    chunk_rows = max(1, chunk_rows)
     path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    mode = "a" if append and path.exists() else "w"
-    write_header = mode == "w"
+    if handle is not None:
+        context: "AbstractContextManager[TextIO]" = nullcontext(handle)
+        write_header = not append
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        mode = "a" if append and path.exists() else "w"
+        write_header = mode == "w"
+        # A 1 MiB buffer batches the many small csv writes into few large
+        # write() syscalls; the default 8 KiB buffer flushes hundreds of
+        # times on a multi-megabyte export.
+        context = path.open(mode, newline="", encoding="utf-8", buffering=1 << 20)
+
+    rows = (restaurant.as_row() for restaurant in restaurants)
     count = 0
-
-    with path.open(mode, newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
+    with context as handle:
+        # The schema is fixed and _escape_csv_field reproduces csv.writer's
+        # QUOTE_MINIMAL quoting, so rows are composed with plain join calls
+        # and each batch lands in a single write — no csv-module dispatch per
+        # row. islice chunks still bound how many rows are held at once.
+        write = handle.write
+        escape = _escape_csv_field
         if write_header:
-            writer.writerow(default_output_fields())
-        for restaurant in restaurants:
-            writer.writerow(restaurant.as_row())
-            count += 1
+            write(",".join(default_output_fields()) + "\r\n")
+        while chunk := list(islice(rows, chunk_rows)):
+            write("\r\n".join(",".join([escape(field) for field in row]) for row in chunk) + "\r\n")
+            count += len(chunk)
+            handle.flush()
 
     logger.info("Wrote %d rows to %s", count, path)
 
@@ -74,9 +157,16 @@ def write_to_csv(restaurants: Iterable[Restaurant], path: str | Path, append: bo
 def deduplicate_restaurants(restaurants: Iterable[Restaurant]) -> List[Restaurant]:
     """Return restaurants with duplicates (by URL) removed while preserving order."""
 
-    seen: OrderedDict[str, Restaurant] = OrderedDict()
-    for restaurant in restaurants:
-        key = restaurant.url.strip().lower() if restaurant.url else restaurant.name.lower()
-        if key not in seen:
-            seen[key] = restaurant
+    # Pull the key source into its own list, then normalize it with chained
+    # map(str.strip/str.lower) calls: both are C callables, so the whole pass
+    # runs without re-entering the interpreter per element. Insertion goes
+    # through a bound setdefault so each restaurant costs a single hash
+    # lookup and, dicts being insertion-ordered, the first occurrence wins.
+    restaurants = list(restaurants)
+    urls = [restaurant.url or restaurant.name for restaurant in restaurants]
+    keys = list(map(str.lower, map(str.strip, urls)))
+    seen: Dict[str, Restaurant] = {}
+    setdefault = seen.setdefault
+    for key, restaurant in zip(keys, restaurants):
+        setdefault(key, restaurant)
     return list(seen.values())
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Mapping, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+from urllib.parse import urlencode, urljoin
 
 DEFAULT_BASE_URL = "https://www.diner-cadeau.nl"
 # Listing pages for Diner Cadeau are exposed under the ``/dinerbon-restaurants``
@@ -30,16 +33,27 @@ class FetchSettings:
     max_pages: int = 5
     request_timeout: int = 30
     pause_seconds: float = 1.0
+    concurrency: int = 1
     user_agent: str = (
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/121.0 Safari/537.36"
     )
     extra_headers: Mapping[str, str] = field(default_factory=dict)
+    _headers_cache: Optional[Mapping[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
-    def headers(self) -> Dict[str, str]:
-        headers = {"User-Agent": self.user_agent, "Accept-Language": "nl-NL,nl;q=0.9,en;q=0.8"}
-        headers.update(self.extra_headers)
-        return headers
+    def headers(self) -> Mapping[str, str]:
+        """Return the request headers, built once and reused afterwards.
+
+        The cached dict is handed out behind a ``MappingProxyType`` view, so
+        every fetch in the loop shares one allocation and no caller can
+        mutate the cache by accident.
+        """
+
+        if self._headers_cache is None:
+            headers = {"User-Agent": self.user_agent, "Accept-Language": "nl-NL,nl;q=0.9,en;q=0.8"}
+            headers.update(self.extra_headers)
+            self._headers_cache = MappingProxyType(headers)
+        return self._headers_cache
 
 
 @dataclass(slots=True)
@@ -47,14 +61,29 @@ class GeocodeSettings:
     """Settings used to geocode addresses and compute distances."""
 
     provider_url: str = "https://nominatim.openstreetmap.org/search"
+    #: Additional Nominatim-compatible endpoints (e.g. a self-hosted instance)
+    #: that lookups may be spread across; each keeps its own rate budget.
+    provider_urls: Sequence[str] = ()
     email: Optional[str] = None
     pause_seconds: float = 1.0
     timeout: int = 30
+    cache_path: Optional[str] = None
+    _base_params: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     def query_params(self, query: str) -> Dict[str, str]:
-        params = {"format": "jsonv2", "q": query, "limit": "1"}
-        if self.email:
-            params["email"] = self.email
+        """Return the query parameters, copying a cached static base.
+
+        Only ``q`` varies between lookups; the format/limit/email portion is
+        assembled once instead of per request.
+        """
+
+        if self._base_params is None:
+            base = {"format": "jsonv2", "limit": "1"}
+            if self.email:
+                base["email"] = self.email
+            self._base_params = base
+        params = dict(self._base_params)
+        params["q"] = query
         return params
 
 
@@ -66,45 +95,56 @@ class PipelineSettings:
     geocode: GeocodeSettings = field(default_factory=GeocodeSettings)
     output_csv: str = "dinercadeau_restaurants.csv"
     append: bool = False
+    #: Rows written (and flushed) per CSV batch during export.
+    csv_chunk_rows: int = 1000
     include_ratings: bool = True
     include_geocoding: bool = True
 
 
+@functools.lru_cache(maxsize=32)
+def _listing_base(base_url: str, list_path: str) -> str:
+    """Join and memoize the listing base URL for a base/path pair."""
+
+    return urljoin(base_url, list_path)
+
+
 def build_listing_url(settings: FetchSettings, page: int) -> str:
     """Return the absolute URL for a listing page."""
 
-    from urllib.parse import urlencode, urljoin
-
     query = {}
     if page > 1:
         query["page"] = page
     if settings.city:
         query["plaats"] = settings.city
 
-    base = urljoin(settings.base_url, settings.list_path)
+    base = _listing_base(settings.base_url, settings.list_path)
     if not query:
         return base
     return f"{base}?{urlencode(query)}"
 
 
+#: Column names used when exporting to CSV, in row order.
+DEFAULT_OUTPUT_FIELDS: tuple[str, ...] = (
+    "name",
+    "url",
+    "city",
+    "address",
+    "postal_code",
+    "country",
+    "description",
+    "tags",
+    "price_range",
+    "rating",
+    "review_count",
+    "latitude",
+    "longitude",
+    "distance_km_from_utrecht",
+    "source",
+    "scraped_at",
+)
+
+
 def default_output_fields() -> Iterable[str]:
     """Return the column names used when exporting to CSV."""
 
-    return [
-        "name",
-        "url",
-        "city",
-        "address",
-        "postal_code",
-        "country",
-        "description",
-        "tags",
-        "price_range",
-        "rating",
-        "review_count",
-        "latitude",
-        "longitude",
-        "distance_km_from_utrecht",
-        "source",
-        "scraped_at",
-    ]
+    return DEFAULT_OUTPUT_FIELDS
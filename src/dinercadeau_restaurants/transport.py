@@ -0,0 +1,177 @@
+"""HTTP transport helpers shared by the fetcher and geocoder."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Mapping, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+HTTPClient = Union[requests.Session, "httpx.Client"]
+
+#: Exception types raised by either client on transport failures.
+REQUEST_ERRORS: tuple = (
+    (requests.RequestException,) if httpx is None else (requests.RequestException, httpx.HTTPError)
+)
+
+#: Retry policy applied to transient server errors on both client backends.
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+
+
+if httpx is not None:
+
+    class _RetryTransport(httpx.HTTPTransport):
+        """Transport that retries transient 5xx responses with backoff.
+
+        httpx's built-in ``retries`` argument only re-attempts connection
+        setup; this adds the status-based retry that the ``requests``
+        fallback gets from urllib3's ``Retry``, so both backends behave the
+        same on a flaky origin.
+        """
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            for attempt in range(_RETRY_TOTAL):
+                response = super().handle_request(request)
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                response.close()
+                time.sleep(_RETRY_BACKOFF * (2**attempt))
+            return super().handle_request(request)
+
+    class _AsyncRetryTransport(httpx.AsyncHTTPTransport):
+        """Asyncio counterpart of :class:`_RetryTransport`."""
+
+        async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+            for attempt in range(_RETRY_TOTAL):
+                response = await super().handle_async_request(request)
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                await response.aclose()
+                await asyncio.sleep(_RETRY_BACKOFF * (2**attempt))
+            return await super().handle_async_request(request)
+
+
+class RateLimiter:
+    """Token gate capping the aggregate request rate at one per pause window.
+
+    Each caller reserves the next send slot under a lock against a monotonic
+    clock, then sleeps outside it, so any number of threads (or tasks, via
+    :meth:`wait_async`) share one global budget instead of pacing
+    independently. A ``pause_seconds`` of zero disables the gate.
+    """
+
+    def __init__(self, pause_seconds: float) -> None:
+        self.pause_seconds = max(0.0, pause_seconds)
+        self._lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    @property
+    def next_request_at(self) -> float:
+        """Monotonic timestamp at which the next token becomes available."""
+
+        return self._next_request_at
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(self._next_request_at, now) + self.pause_seconds
+        return wait
+
+    def wait(self) -> None:
+        """Block until the configured rate allows another request."""
+
+        if not self.pause_seconds:
+            return
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug("Pacing %.2f seconds before next request", wait)
+            time.sleep(wait)
+
+    async def wait_async(self) -> None:
+        """Asyncio variant of :meth:`wait` that never blocks the event loop."""
+
+        if not self.pause_seconds:
+            return
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def create_client(
+    headers: Optional[Mapping[str, str]] = None,
+    pool_size: int = 20,
+) -> HTTPClient:
+    """Return an HTTP client, preferring HTTP/2 via ``httpx`` when available.
+
+    ``httpx.Client`` multiplexes concurrent requests to one host over a single
+    TLS connection, saving a handshake per request compared to HTTP/1.1
+    keep-alive. When ``httpx`` (or its ``h2`` extra) is not installed, a plain
+    ``requests.Session`` is returned instead; both expose the ``get`` and
+    ``headers`` surface used throughout this package. Redirects are followed
+    on both clients — ``requests`` does so by default, ``httpx`` only when
+    asked — so a 301 from the site never surfaces as a status error.
+
+    ``pool_size`` bounds the connection pool of either client. Size it to the
+    caller's concurrency so parallel workers never discard and reopen sockets
+    mid-crawl. Both clients retry transient 5xx responses (500/502/503/504)
+    with backoff as well as failed connection attempts: ``requests`` via
+    urllib3's ``Retry``, ``httpx`` via :class:`_RetryTransport`.
+    """
+
+    pool_size = max(1, pool_size)
+    if httpx is not None:
+        limits = httpx.Limits(max_keepalive_connections=pool_size, max_connections=pool_size)
+        try:
+            transport = _RetryTransport(http2=True, limits=limits, retries=_RETRY_TOTAL)
+        except ImportError:
+            logger.debug("httpx is installed without the h2 extra; using HTTP/1.1")
+            transport = _RetryTransport(limits=limits, retries=_RETRY_TOTAL)
+        client = httpx.Client(transport=transport, follow_redirects=True)
+        if headers:
+            client.headers.update(headers)
+        return client
+
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def create_async_client(headers: Optional[Mapping[str, str]] = None) -> "httpx.AsyncClient":
+    """Return an ``httpx.AsyncClient`` for the asyncio code paths.
+
+    Unlike :func:`create_client` there is no ``requests`` fallback; the async
+    pipeline requires ``httpx`` and raises ``ImportError`` when it is missing.
+    """
+
+    if httpx is None:
+        raise ImportError("httpx is required for async fetching; pip install httpx[http2]")
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=20)
+    try:
+        transport = _AsyncRetryTransport(http2=True, limits=limits, retries=_RETRY_TOTAL)
+    except ImportError:
+        logger.debug("httpx is installed without the h2 extra; using HTTP/1.1")
+        transport = _AsyncRetryTransport(limits=limits, retries=_RETRY_TOTAL)
+    client = httpx.AsyncClient(transport=transport, follow_redirects=True)
+    if headers:
+        client.headers.update(headers)
+    return client